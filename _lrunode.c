@@ -0,0 +1,306 @@
+/*
+ * _lrunode: C implementation of the LRU cache hot path.
+ *
+ * Structure-of-Arrays layout: instead of one heap node object per
+ * entry, the cache keeps parallel arrays indexed by an integer slot —
+ * keys[] and values[] (owned references) plus prev[] and next[]
+ * (Py_ssize_t slot indices forming an intrusive doubly linked list,
+ * with two sentinel slots for the head and tail).  The hash map is a
+ * PyDict from key to boxed slot index.  Moving an entry is four
+ * integer stores into contiguous arrays rather than pointer chasing
+ * through per-node PyObjects.
+ *
+ * Thread-safety: every call runs under the GIL and never releases it,
+ * so get()/put() are atomic with respect to each other for keys whose
+ * __hash__/__eq__ do not call back into Python (int, str, bytes, ...).
+ * This matches the approach taken by lru-dict.
+ */
+
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+#include <structmember.h>
+
+typedef struct {
+    PyObject_HEAD
+    Py_ssize_t capacity;
+    PyObject *dict;         /* key -> boxed slot index */
+    PyObject **keys;        /* [capacity] owned refs, NULL when free */
+    PyObject **values;      /* [capacity] owned refs, NULL when free */
+    Py_ssize_t *prev;       /* [capacity + 2] slot links */
+    Py_ssize_t *next;       /* [capacity + 2] slot links */
+    Py_ssize_t head;        /* sentinel slot, most recent end */
+    Py_ssize_t tail;        /* sentinel slot, least recent end */
+    Py_ssize_t *free_slots; /* stack of unused slot indices */
+    Py_ssize_t free_top;    /* number of entries on the stack */
+    PyObject **slot_boxes;  /* [capacity] preallocated boxed indices */
+} LRUObject;
+
+/* List surgery: four indexed integer stores per move. */
+
+static void
+lru_remove_slot(LRUObject *self, Py_ssize_t slot)
+{
+    Py_ssize_t p = self->prev[slot];
+    Py_ssize_t n = self->next[slot];
+    self->next[p] = n;
+    self->prev[n] = p;
+}
+
+static void
+lru_add_slot(LRUObject *self, Py_ssize_t slot)
+{
+    Py_ssize_t first = self->next[self->head];
+    self->prev[slot] = self->head;
+    self->next[slot] = first;
+    self->prev[first] = slot;
+    self->next[self->head] = slot;
+}
+
+static PyObject *
+lru_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
+{
+    static char *kwlist[] = {"capacity", NULL};
+    Py_ssize_t capacity;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "n:LRUCache", kwlist,
+                                     &capacity)) {
+        return NULL;
+    }
+    if (capacity <= 0) {
+        PyErr_SetString(PyExc_ValueError, "Capacity must be positive");
+        return NULL;
+    }
+
+    LRUObject *self = (LRUObject *)type->tp_alloc(type, 0);
+    if (self == NULL) {
+        return NULL;
+    }
+    self->capacity = capacity;
+    self->dict = PyDict_New();
+    self->keys = PyMem_Calloc(capacity, sizeof(PyObject *));
+    self->values = PyMem_Calloc(capacity, sizeof(PyObject *));
+    self->prev = PyMem_Malloc((capacity + 2) * sizeof(Py_ssize_t));
+    self->next = PyMem_Malloc((capacity + 2) * sizeof(Py_ssize_t));
+    self->free_slots = PyMem_Malloc(capacity * sizeof(Py_ssize_t));
+    self->slot_boxes = PyMem_Calloc(capacity, sizeof(PyObject *));
+    if (self->dict == NULL || self->keys == NULL || self->values == NULL ||
+        self->prev == NULL || self->next == NULL ||
+        self->free_slots == NULL || self->slot_boxes == NULL) {
+        Py_DECREF(self);
+        PyErr_NoMemory();
+        return NULL;
+    }
+
+    /* Preallocate the boxed slot indices once, so steady-state put()
+     * performs no allocations at all. */
+    for (Py_ssize_t i = 0; i < capacity; i++) {
+        self->slot_boxes[i] = PyLong_FromSsize_t(i);
+        if (self->slot_boxes[i] == NULL) {
+            Py_DECREF(self);
+            return NULL;
+        }
+    }
+
+    /* Sentinels occupy the two slots past the entry range. */
+    self->head = capacity;
+    self->tail = capacity + 1;
+    self->next[self->head] = self->tail;
+    self->prev[self->tail] = self->head;
+
+    for (Py_ssize_t i = 0; i < capacity; i++) {
+        self->free_slots[i] = capacity - 1 - i;
+    }
+    self->free_top = capacity;
+    return (PyObject *)self;
+}
+
+static int
+lru_traverse(LRUObject *self, visitproc visit, void *arg)
+{
+    Py_VISIT(self->dict);
+    if (self->keys != NULL) {
+        for (Py_ssize_t i = 0; i < self->capacity; i++) {
+            Py_VISIT(self->keys[i]);
+            Py_VISIT(self->values[i]);
+        }
+    }
+    return 0;
+}
+
+static int
+lru_clear_refs(LRUObject *self)
+{
+    Py_CLEAR(self->dict);
+    if (self->keys != NULL) {
+        for (Py_ssize_t i = 0; i < self->capacity; i++) {
+            Py_CLEAR(self->keys[i]);
+            Py_CLEAR(self->values[i]);
+        }
+    }
+    return 0;
+}
+
+static void
+lru_dealloc(LRUObject *self)
+{
+    PyObject_GC_UnTrack(self);
+    (void)lru_clear_refs(self);
+    if (self->slot_boxes != NULL) {
+        for (Py_ssize_t i = 0; i < self->capacity; i++) {
+            Py_XDECREF(self->slot_boxes[i]);
+        }
+    }
+    PyMem_Free(self->slot_boxes);
+    PyMem_Free(self->keys);
+    PyMem_Free(self->values);
+    PyMem_Free(self->prev);
+    PyMem_Free(self->next);
+    PyMem_Free(self->free_slots);
+    Py_TYPE(self)->tp_free((PyObject *)self);
+}
+
+static PyObject *
+lru_get(LRUObject *self, PyObject *key)
+{
+    PyObject *box = PyDict_GetItemWithError(self->dict, key);
+    if (box == NULL) {
+        if (PyErr_Occurred()) {
+            return NULL;
+        }
+        return PyLong_FromLong(-1);
+    }
+    Py_ssize_t slot = PyLong_AsSsize_t(box);
+    /* Move to head to mark as recently used. */
+    lru_remove_slot(self, slot);
+    lru_add_slot(self, slot);
+    return Py_NewRef(self->values[slot]);
+}
+
+static PyObject *
+lru_put(LRUObject *self, PyObject *args)
+{
+    PyObject *key, *value;
+
+    if (!PyArg_ParseTuple(args, "OO:put", &key, &value)) {
+        return NULL;
+    }
+
+    PyObject *box = PyDict_GetItemWithError(self->dict, key);
+    if (box != NULL) {
+        /* Existing key: update value in place and move to head. */
+        Py_ssize_t slot = PyLong_AsSsize_t(box);
+        Py_INCREF(value);
+        Py_SETREF(self->values[slot], value);
+        lru_remove_slot(self, slot);
+        lru_add_slot(self, slot);
+        Py_RETURN_NONE;
+    }
+    if (PyErr_Occurred()) {
+        return NULL;
+    }
+
+    Py_ssize_t slot;
+    int reused = 0;
+    if (PyDict_GET_SIZE(self->dict) >= self->capacity) {
+        /* Evict the LRU slot (tail.prev) and reuse it in place for
+         * the new entry, skipping the free-stack round trip. */
+        Py_ssize_t victim = self->prev[self->tail];
+        PyObject *evict_key = Py_NewRef(self->keys[victim]);
+        lru_remove_slot(self, victim);
+        int status = PyDict_DelItem(self->dict, evict_key);
+        Py_DECREF(evict_key);
+        if (status < 0) {
+            return NULL;
+        }
+        Py_CLEAR(self->keys[victim]);
+        Py_CLEAR(self->values[victim]);
+        slot = victim;
+        reused = 1;
+    }
+    else {
+        if (self->free_top <= 0) {
+            PyErr_SetString(PyExc_SystemError,
+                            "LRU slot accounting corrupted");
+            return NULL;
+        }
+        slot = self->free_slots[self->free_top - 1];
+    }
+
+    /* The boxed index is preallocated; SetItem just takes a reference. */
+    if (PyDict_SetItem(self->dict, key, self->slot_boxes[slot]) < 0) {
+        if (reused) {
+            self->free_slots[self->free_top++] = slot;
+        }
+        return NULL;
+    }
+    if (!reused) {
+        self->free_top--;
+    }
+    self->keys[slot] = Py_NewRef(key);
+    self->values[slot] = Py_NewRef(value);
+    lru_add_slot(self, slot);
+    Py_RETURN_NONE;
+}
+
+static Py_ssize_t
+lru_length(LRUObject *self)
+{
+    return PyDict_GET_SIZE(self->dict);
+}
+
+static PySequenceMethods lru_as_sequence = {
+    .sq_length = (lenfunc)lru_length,
+};
+
+static PyMethodDef lru_methods[] = {
+    {"get", (PyCFunction)lru_get, METH_O,
+     "Get the value for a key if it exists, otherwise return -1."},
+    {"put", (PyCFunction)lru_put, METH_VARARGS,
+     "Insert or update a key-value pair, evicting the LRU item if full."},
+    {NULL, NULL, 0, NULL},
+};
+
+static PyMemberDef lru_members[] = {
+    {"capacity", T_PYSSIZET, offsetof(LRUObject, capacity), READONLY,
+     "Maximum number of items the cache can hold."},
+    {NULL},
+};
+
+static PyTypeObject LRU_Type = {
+    PyVarObject_HEAD_INIT(NULL, 0)
+    .tp_name = "_lrunode.LRUCache",
+    .tp_basicsize = sizeof(LRUObject),
+    .tp_dealloc = (destructor)lru_dealloc,
+    .tp_as_sequence = &lru_as_sequence,
+    .tp_flags = Py_TPFLAGS_DEFAULT | Py_TPFLAGS_HAVE_GC,
+    .tp_doc = "Thread-safe LRU cache (C implementation).",
+    .tp_traverse = (traverseproc)lru_traverse,
+    .tp_clear = (inquiry)lru_clear_refs,
+    .tp_methods = lru_methods,
+    .tp_members = lru_members,
+    .tp_new = lru_new,
+};
+
+static struct PyModuleDef lrunodemodule = {
+    PyModuleDef_HEAD_INIT,
+    .m_name = "_lrunode",
+    .m_doc = "C implementation of the LRU cache hot path.",
+    .m_size = -1,
+};
+
+PyMODINIT_FUNC
+PyInit__lrunode(void)
+{
+    if (PyType_Ready(&LRU_Type) < 0) {
+        return NULL;
+    }
+    PyObject *m = PyModule_Create(&lrunodemodule);
+    if (m == NULL) {
+        return NULL;
+    }
+    if (PyModule_AddObjectRef(m, "LRUCache", (PyObject *)&LRU_Type) < 0) {
+        Py_DECREF(m);
+        return NULL;
+    }
+    return m;
+}
@@ -1,306 +1,695 @@
 """
 Thread-safe LRU Cache Implementation
 
-Design: HashMap + Doubly Linked List
+Design: insertion-ordered builtin dict
 Time Complexity: O(1) for both get() and put()
 Space Complexity: O(capacity)
 """
 
+import _thread
 import threading
+from array import array
+from functools import lru_cache
+from operator import index as _index
 
+# Sentinel distinguishing "key absent" from any cached value
+_MISS = object()
+
+# Buffered recency updates per thread before a forced flush
+_PENDING_MAX = 64
+
+# Bloom filter over resident keys: one byte per position (byte reads and
+# writes are atomic under the GIL), 4 probes carved from the 64-bit hash
+_BLOOM_SIZE = 1 << 16
+_BLOOM_MASK = _BLOOM_SIZE - 1
+_BLOOM_ZEROS = bytes(_BLOOM_SIZE)  # reused by clear(): no fresh buffer
+
+# Evictions tolerated before stale filter bits are rebuilt away
+_BLOOM_REBUILD_EVICTIONS = 4096
+
+# Bounds of IntLRUCache's array('q') storage
+_INT64_MIN = -(1 << 63)
+_INT64_MAX = (1 << 63) - 1
 
-class _Node:
-    """
-    Internal node class for doubly linked list.
-    Each node stores a key-value pair and pointers to adjacent nodes.
-    """
-    def __init__(self, key=0, value=0):
-        self.key = key
-        self.value = value
-        self.prev = None
-        self.next = None
+
+def _bloom_add(bloom, key) -> None:
+    """Set the 4 filter bytes for a key."""
+    h = hash(key) & 0xFFFFFFFFFFFFFFFF
+    bloom[h & _BLOOM_MASK] = 1
+    bloom[(h >> 16) & _BLOOM_MASK] = 1
+    bloom[(h >> 32) & _BLOOM_MASK] = 1
+    bloom[(h >> 48) & _BLOOM_MASK] = 1
 
 
 class LRUCache:
     """
-    Thread-safe LRU Cache using HashMap + Doubly Linked List.
-    
-    The cache maintains:
-    - A dictionary (cache) for O(1) key lookups
-    - A doubly linked list to track access order (most recent at head)
-    - Dummy head and tail nodes to simplify edge case handling
-    - A lock for thread-safety
+    Thread-safe Segmented LRU (SLRU) Cache built on the insertion order
+    of the builtin dict (guaranteed since Python 3.7).
+
+    The cache maintains two segments, each a dict ordered least
+    recently used first:
+    - probation: where new keys land on put()
+    - protected: where keys are promoted on their first get() hit
+
+    Eviction always drains probation first and only touches protected
+    when probation is empty, so a scan of one-shot keys churns through
+    probation without displacing keys that have proven reuse. A lock
+    provides thread-safety for mutations.
+
+    Recency bookkeeping needs no linked list at all: pop-and-reinsert
+    (d[key] = d.pop(key)) moves an entry to the MRU end and
+    del d[next(iter(d))] evicts the LRU entry, both O(1) in C. Compared
+    to OrderedDict this drops the per-entry link node, roughly halving
+    memory per entry.
     """
-    
+
+    __slots__ = ("capacity", "probation", "protected", "lock",
+                 "_version", "_pending", "_bloom", "_evictions")
+
     def __init__(self, capacity: int):
         """
         Initialize the LRU cache.
-        
+
+        Args:
+            capacity: Maximum number of items the cache can hold
+        """
+        if capacity <= 0:
+            raise ValueError("Capacity must be positive")
+
+        self.capacity = capacity
+        # Both segments map key -> value, LRU entry first; together
+        # they hold at most `capacity` entries
+        self.probation = {}
+        self.protected = {}
+
+        # Coarse-grained lock for thread-safety. This is the raw C lock
+        # that threading.Lock aliases — already the thinnest mutex
+        # available. A userspace spinlock would be slower here: a
+        # spinning thread holds the GIL and starves the lock holder,
+        # so the kernel-assisted wait is the right primitive.
+        self.lock = _thread.allocate_lock()
+
+        # SeqLock-style version counter: put() increments it before and
+        # after mutating (odd = writer active), so lock-free readers can
+        # detect a concurrent write and fall back to the locked path.
+        self._version = 0
+
+        # Per-thread buffer of keys awaiting their move-to-end recency
+        # update, replayed under the lock by flush() and put().
+        self._pending = threading.local()
+
+        # Bloom filter over resident keys so get() misses bail out on a
+        # few byte reads without locking or probing the segments. Bits
+        # go stale on eviction (false positives only); the filter is
+        # rebuilt after _BLOOM_REBUILD_EVICTIONS evictions.
+        self._bloom = bytearray(_BLOOM_SIZE)
+        self._evictions = 0
+
+    def get(self, key: int) -> int:
+        """
+        Get the value for a key if it exists, otherwise return -1.
+        Accessing a key marks it as most recently used.
+
+        The fast path is a SeqLock read: snapshot the version counter,
+        read the value without the lock (atomic under the GIL), then
+        re-check the counter. If no put() ran concurrently the read is
+        consistent and the hit never acquires the lock — the recency
+        update is buffered in a thread-local list and replayed in bulk
+        (see flush()). Misses are entirely lock-free. If a put() was in
+        flight the read retries under the lock.
+
+        Time Complexity: O(1)
+        """
+        # Negative cache: if any filter byte is unset the key cannot be
+        # resident, so most misses cost 4 byte reads and nothing else.
+        # A concurrent rebuild swaps in a fresh filter atomically, so a
+        # single snapshot of the reference is always safe to probe.
+        h = hash(key) & 0xFFFFFFFFFFFFFFFF
+        bloom = self._bloom
+        if not (bloom[h & _BLOOM_MASK]
+                and bloom[(h >> 16) & _BLOOM_MASK]
+                and bloom[(h >> 32) & _BLOOM_MASK]
+                and bloom[(h >> 48) & _BLOOM_MASK]):
+            return -1
+        version = self._version
+        if not version & 1:  # Even: no writer active
+            value = self.protected.get(key, _MISS)
+            if value is _MISS:
+                value = self.probation.get(key, _MISS)
+            if self._version == version:  # Unchanged: read is consistent
+                if value is _MISS:
+                    return -1
+                self._record_access(key)
+                return value
+        # A put() was in flight: retry under the lock.
+        with self.lock:
+            value = self.protected.get(key, _MISS)
+            if value is _MISS:
+                value = self.probation.get(key, _MISS)
+        if value is _MISS:
+            return -1
+        self._record_access(key)
+        return value
+
+    def _record_access(self, key) -> None:
+        """
+        Buffer a recency update for this thread, flushing when full.
+
+        Batching amortizes the lock: one acquisition covers up to
+        _PENDING_MAX move-to-end updates instead of one per hit.
+        """
+        buf = getattr(self._pending, "buf", None)
+        if buf is None:
+            buf = self._pending.buf = []
+        buf.append(key)
+        if len(buf) >= _PENDING_MAX:
+            self.flush()
+
+    def _replay(self, buf) -> None:
+        """
+        Apply buffered recency updates in access order. Caller must
+        hold the lock with the version counter already odd.
+
+        A hit on a probation key counts as its second touch (the put()
+        was the first), so it is promoted into protected.
+        """
+        probation = self.probation
+        protected = self.protected
+        for key in buf:
+            if key in protected:
+                # Pop-and-reinsert moves the entry to the MRU end
+                protected[key] = protected.pop(key)
+            elif key in probation:
+                protected[key] = probation.pop(key)
+        buf.clear()
+
+    def clear(self) -> None:
+        """
+        Remove every entry, resetting all storage in place.
+
+        The segment dicts and Bloom filter are cleared rather than
+        reallocated (and this thread's pending buffer is dropped), so
+        repeatedly purging a large cache causes no allocator or GC
+        spikes. Other threads' pending buffers become harmless: replay
+        skips keys that are no longer resident.
+        """
+        buf = getattr(self._pending, "buf", None)
+        with self.lock:
+            self._version += 1
+            try:
+                if buf:
+                    buf.clear()
+                self.probation.clear()
+                self.protected.clear()
+                self._bloom[:] = _BLOOM_ZEROS
+                self._evictions = 0
+            finally:
+                self._version += 1
+
+    def _rebuild_bloom(self) -> None:
+        """
+        Rebuild the Bloom filter from the resident keys, discarding
+        bits left stale by evictions. Caller must hold the lock.
+
+        The fresh filter is swapped in with a single reference store,
+        so lock-free readers probe either the stale superset or the
+        exact rebuild — never a partially populated filter (which
+        could report a resident key as missing).
+        """
+        bloom = bytearray(_BLOOM_SIZE)
+        for key in self.probation:
+            _bloom_add(bloom, key)
+        for key in self.protected:
+            _bloom_add(bloom, key)
+        self._bloom = bloom
+        self._evictions = 0
+
+    def flush(self) -> None:
+        """
+        Replay this thread's buffered recency updates into the cache.
+
+        Called automatically when the buffer fills and at the start of
+        every put(), so LRU order is exact again at each eviction
+        point. Between flushes the order is slightly stale, bounded by
+        _PENDING_MAX accesses per thread. Each thread replays only its
+        own buffer.
+        """
+        buf = getattr(self._pending, "buf", None)
+        if not buf:
+            return
+        with self.lock:
+            self._version += 1
+            try:
+                self._replay(buf)
+            finally:
+                self._version += 1
+
+    def put(self, key: int, value: int) -> None:
+        """
+        Insert or update a key-value pair. New keys enter the probation
+        segment; if capacity is exceeded, the least recently used
+        probation entry is evicted (protected entries only once
+        probation is empty).
+
+        Time Complexity: O(1)
+        """
+        buf = getattr(self._pending, "buf", None)
+        with self.lock:
+            self._version += 1  # Odd: writer active
+            try:
+                if buf:
+                    # Catch the LRU order up before deciding eviction
+                    self._replay(buf)
+                if key in self.protected:
+                    # Existing hot key: refresh recency and overwrite
+                    self.protected.pop(key)
+                    self.protected[key] = value
+                elif key in self.probation:
+                    # Existing probation key: update without promoting
+                    self.probation.pop(key)
+                    self.probation[key] = value
+                else:
+                    if (len(self.probation) + len(self.protected)
+                            >= self.capacity):
+                        # Evict from probation first; only touch the
+                        # protected segment once probation is empty
+                        victim = self.probation or self.protected
+                        del victim[next(iter(victim))]
+                        self._evictions += 1
+                        if self._evictions >= _BLOOM_REBUILD_EVICTIONS:
+                            self._rebuild_bloom()
+                    # New keys start in probation
+                    self.probation[key] = value
+                    _bloom_add(self._bloom, key)
+            finally:
+                self._version += 1  # Even again: mutation published
+
+    @staticmethod
+    def memoize(capacity: int):
+        """
+        Return a function decorator backed by functools.lru_cache.
+
+        For callers that want LRU caching of a function's results rather
+        than an explicit get/put mapping, functools.lru_cache provides
+        the same eviction policy implemented entirely in C (and is
+        thread-safe). Use this instead of wrapping an LRUCache by hand.
+
+        Args:
+            capacity: Maximum number of results to cache
+
+        Time Complexity: O(1) per call
+        """
+        if capacity <= 0:
+            raise ValueError("Capacity must be positive")
+        return lru_cache(maxsize=capacity, typed=False)
+
+
+class IntLRUCache(LRUCache):
+    """
+    LRU cache specialized for int keys and values.
+
+    Entries live in parallel arrays indexed by an integer slot: keys
+    and values in array('q'), prev/next list links in array('l'), with
+    a dict mapping key -> slot. Each entry costs four fixed-width array
+    cells plus one dict entry instead of boxed Python objects, roughly
+    halving memory per entry for int-only workloads. The recency list
+    is terminated with -1 and tracked by explicit head (MRU) and tail
+    (LRU) slot indices — no sentinel cells.
+
+    Eviction is exact LRU (single list, no segments) and every
+    operation runs under the lock. Keys and values must fit in a
+    signed 64-bit integer.
+    """
+
+    __slots__ = ("cache", "keys", "vals", "prev", "next", "free",
+                 "head", "tail")
+
+    def __init__(self, capacity: int):
+        """
+        Initialize the int-specialized LRU cache.
+
         Args:
             capacity: Maximum number of items the cache can hold
         """
         if capacity <= 0:
             raise ValueError("Capacity must be positive")
-        
+
         self.capacity = capacity
-        self.cache = {}  # HashMap: key -> Node mapping for O(1) lookup
-        
-        # Dummy head and tail nodes eliminate edge cases
-        # Head is most recently used, tail is least recently used
-        self.head = _Node()
-        self.tail = _Node()
-        self.head.next = self.tail
-        self.tail.prev = self.head
-        
-        # Coarse-grained lock for thread-safety
-        self.lock = threading.Lock()
-    
-    def _add_node(self, node: _Node) -> None:
-        """
-        Add a node right after the head (most recent position).
-        This is O(1) because we always insert at a known position.
-        """
-        # Insert node between head and head.next
-        node.prev = self.head
-        node.next = self.head.next
-        
-        # Update adjacent nodes' pointers
-        self.head.next.prev = node
-        self.head.next = node
-    
-    def _remove_node(self, node: _Node) -> None:
-        """
-        Remove a node from the doubly linked list.
-        This is O(1) because we have direct reference to the node.
-        """
-        prev_node = node.prev
-        next_node = node.next
-        
-        prev_node.next = next_node
-        next_node.prev = prev_node
-    
-    def _move_to_head(self, node: _Node) -> None:
-        """
-        Move an existing node to the head (mark as most recently used).
-        This is O(1): remove + add at head.
-        """
-        self._remove_node(node)
-        self._add_node(node)
-    
-    def _pop_tail(self) -> _Node:
-        """
-        Remove and return the tail node (least recently used).
-        This is O(1) because tail.prev is always the LRU node.
-        """
-        lru_node = self.tail.prev
-        self._remove_node(lru_node)
-        return lru_node
-    
+        self.cache = {}  # key -> slot index
+        self.keys = array("q", bytes(8 * capacity))
+        self.vals = array("q", bytes(8 * capacity))
+        self.prev = array("l", [0]) * capacity
+        self.next = array("l", [0]) * capacity
+        self.free = list(range(capacity))  # recycled slot indices
+
+        # -1-terminated list: head is the MRU slot, tail the LRU slot
+        self.head = -1
+        self.tail = -1
+
+        self.lock = _thread.allocate_lock()
+
+    def _remove_slot(self, slot: int) -> None:
+        """Unlink a slot from the recency list."""
+        p = self.prev[slot]
+        n = self.next[slot]
+        if p >= 0:
+            self.next[p] = n
+        else:
+            self.head = n
+        if n >= 0:
+            self.prev[n] = p
+        else:
+            self.tail = p
+
+    def _add_slot(self, slot: int) -> None:
+        """Link a slot at the head of the list (MRU position)."""
+        first = self.head
+        self.prev[slot] = -1
+        self.next[slot] = first
+        if first >= 0:
+            self.prev[first] = slot
+        else:
+            self.tail = slot
+        self.head = slot
+
     def get(self, key: int) -> int:
         """
         Get the value for a key if it exists, otherwise return -1.
         Accessing a key marks it as most recently used.
-        
+
         Time Complexity: O(1)
         """
         with self.lock:
-            node = self.cache.get(key)
-            
-            if node is None:
+            slot = self.cache.get(key, -1)
+            if slot < 0:
                 return -1
-            
-            # Move to head to mark as recently used
-            self._move_to_head(node)
-            return node.value
-    
+            self._remove_slot(slot)
+            self._add_slot(slot)
+            return self.vals[slot]
+
     def put(self, key: int, value: int) -> None:
         """
         Insert or update a key-value pair.
         If capacity is exceeded, evict the least recently used item.
-        
+
         Time Complexity: O(1)
         """
+        # Validate both operands before touching any state: the array
+        # stores below would otherwise fail only after an entry has
+        # been evicted or a slot handed out, corrupting the cache on a
+        # rejected put. _index raises TypeError for non-integers.
+        if not (_INT64_MIN <= _index(key) <= _INT64_MAX
+                and _INT64_MIN <= _index(value) <= _INT64_MAX):
+            raise OverflowError(
+                "IntLRUCache keys and values must fit in a signed "
+                "64-bit integer")
         with self.lock:
-            node = self.cache.get(key)
-            
-            if node is None:
-                # New key: create new node
-                new_node = _Node(key, value)
-                
-                if len(self.cache) >= self.capacity:
-                    # Evict LRU item
-                    tail = self._pop_tail()
-                    del self.cache[tail.key]
-                
-                # Add new node to head and cache
-                self._add_node(new_node)
-                self.cache[key] = new_node
+            slot = self.cache.get(key, -1)
+            if slot >= 0:
+                # Existing key: update value in place and move to head
+                self.vals[slot] = value
+                self._remove_slot(slot)
+                self._add_slot(slot)
+                return
+            if len(self.cache) >= self.capacity:
+                # Evict the LRU slot and reuse it in place
+                slot = self.tail
+                self._remove_slot(slot)
+                del self.cache[self.keys[slot]]
             else:
-                # Existing key: update value and move to head
-                node.value = value
-                self._move_to_head(node)
-
-
-# Test block demonstrating correctness
-if __name__ == "__main__":
-    print("=" * 60)
-    print("LRU Cache Test Suite")
-    print("=" * 60)
-    
-    tests_passed = 0
-    tests_failed = 0
-    
-    def assert_test(condition, test_name, error_msg=""):
-        """Helper to run assertions and track results"""
-        global tests_passed, tests_failed
-        try:
-            assert condition, error_msg
-            print(f"[PASS] {test_name}")
-            tests_passed += 1
-        except AssertionError as e:
-            print(f"[FAIL] {test_name}")
-            if error_msg:
-                print(f"  Error: {error_msg}")
-            tests_failed += 1
-    
-    # Test 1: Basic operations
-    print("\n[Test 1] Basic get/put operations")
-    try:
-        cache = LRUCache(2)
-        cache.put(1, 1)
-        cache.put(2, 2)
-        assert_test(cache.get(1) == 1, "get(1) returns 1")
-        
-        cache.put(3, 3)  # Evicts key 2
-        assert_test(cache.get(2) == -1, "get(2) returns -1 (evicted)")
-        assert_test(cache.get(3) == 3, "get(3) returns 3")
-        
-        cache.put(4, 4)  # Evicts key 1
-        assert_test(cache.get(1) == -1, "get(1) returns -1 (evicted)")
-        assert_test(cache.get(3) == 3, "get(3) still returns 3")
-        assert_test(cache.get(4) == 4, "get(4) returns 4")
-    except Exception as e:
-        assert_test(False, "Test 1 execution", str(e))
-    
-    # Test 2: Update existing key
-    print("\n[Test 2] Update existing key")
-    try:
-        cache2 = LRUCache(2)
-        cache2.put(1, 1)
-        cache2.put(2, 2)
-        cache2.put(1, 10)  # Update key 1
-        assert_test(cache2.get(1) == 10, "get(1) returns updated value 10")
-        assert_test(cache2.get(2) == 2, "get(2) still returns 2")
-    except Exception as e:
-        assert_test(False, "Test 2 execution", str(e))
-    
-    # Test 3: Capacity 1
-    print("\n[Test 3] Edge case: Capacity 1")
-    try:
-        cache3 = LRUCache(1)
-        cache3.put(1, 1)
-        cache3.put(2, 2)
-        assert_test(cache3.get(1) == -1, "get(1) returns -1 (evicted)")
-        assert_test(cache3.get(2) == 2, "get(2) returns 2")
-    except Exception as e:
-        assert_test(False, "Test 3 execution", str(e))
-    
-    # Test 4: Invalid capacity
-    print("\n[Test 4] Invalid capacity handling")
-    try:
-        try:
-            invalid_cache = LRUCache(0)
-            assert_test(False, "LRUCache(0) raises ValueError", "Should raise ValueError for capacity <= 0")
-        except ValueError:
-            assert_test(True, "LRUCache(0) raises ValueError")
-        
-        try:
-            invalid_cache = LRUCache(-1)
-            assert_test(False, "LRUCache(-1) raises ValueError", "Should raise ValueError for capacity <= 0")
-        except ValueError:
-            assert_test(True, "LRUCache(-1) raises ValueError")
-    except Exception as e:
-        assert_test(False, "Test 4 execution", str(e))
-    
-    # Test 5: Multiple evictions
-    print("\n[Test 5] Multiple evictions")
-    try:
-        cache5 = LRUCache(3)
-        cache5.put(1, 1)
-        cache5.put(2, 2)
-        cache5.put(3, 3)
-        cache5.get(1)  # Mark 1 as recently used
-        cache5.put(4, 4)  # Should evict 2 (least recently used)
-        assert_test(cache5.get(2) == -1, "get(2) returns -1 (evicted)")
-        assert_test(cache5.get(1) == 1, "get(1) still returns 1")
-        assert_test(cache5.get(3) == 3, "get(3) still returns 3")
-        assert_test(cache5.get(4) == 4, "get(4) returns 4")
-    except Exception as e:
-        assert_test(False, "Test 5 execution", str(e))
-    
-    # Test 6: Thread safety (concurrent access)
-    print("\n[Test 6] Thread safety with concurrent access")
-    try:
-        cache6 = LRUCache(100)
-        results = []
-        errors = []
-        
-        def worker(thread_id):
-            try:
-                for i in range(50):
-                    key = thread_id * 1000 + i
-                    cache6.put(key, i)
-                    val = cache6.get(key)
-                    results.append(val == i)
-            except Exception as e:
-                errors.append(str(e))
-        
-        threads = [threading.Thread(target=worker, args=(i,)) for i in range(10)]
-        for t in threads:
-            t.start()
-        for t in threads:
-            t.join()
-        
-        assert_test(len(errors) == 0, "No exceptions in threads", f"Errors: {errors}" if errors else "")
-        assert_test(all(results), f"All {len(results)} concurrent operations successful", 
-                   f"Failed operations: {results.count(False)}")
-    except Exception as e:
-        assert_test(False, "Test 6 execution", str(e))
-    
-    # Test 7: Access order maintenance
-    print("\n[Test 7] LRU eviction order correctness")
-    try:
-        cache7 = LRUCache(3)
-        cache7.put(1, 1)
-        cache7.put(2, 2)
-        cache7.put(3, 3)
-        # Access pattern: 1, 3, 2 (1 is most recent, 2 is least recent)
-        cache7.get(1)
-        cache7.get(3)
-        cache7.get(2)
-        # Now 2 is most recent, 1 is least recent
-        cache7.put(4, 4)  # Should evict 1
-        assert_test(cache7.get(1) == -1, "get(1) returns -1 (correctly evicted)")
-        assert_test(cache7.get(2) == 2, "get(2) still returns 2")
-        assert_test(cache7.get(3) == 3, "get(3) still returns 3")
-        assert_test(cache7.get(4) == 4, "get(4) returns 4")
-    except Exception as e:
-        assert_test(False, "Test 7 execution", str(e))
-    
-    # Summary
-    print("\n" + "=" * 60)
-    print("TEST SUMMARY")
-    print("=" * 60)
-    print(f"Total Tests: {tests_passed + tests_failed}")
-    print(f"Passed: {tests_passed}")
-    print(f"Failed: {tests_failed}")
-    
-    if tests_failed == 0:
-        print("\n[SUCCESS] ALL TESTS PASSED!")
-        print("=" * 60)
-        exit(0)
-    else:
-        print(f"\n[ERROR] {tests_failed} TEST(S) FAILED")
-        print("=" * 60)
-        exit(1)
+                slot = self.free.pop()
+            self.keys[slot] = key
+            self.vals[slot] = value
+            self.cache[key] = slot
+            self._add_slot(slot)
+
+    def flush(self) -> None:
+        """No-op: recency updates here are applied inline under the lock."""
+
+    def clear(self) -> None:
+        """
+        Remove every entry, resetting the slot bookkeeping in place.
+
+        The slot dict, free list, and sentinel links are reset without
+        reallocating the backing arrays.
+        """
+        with self.lock:
+            self.cache.clear()
+            del self.free[:]
+            self.free.extend(range(self.capacity))
+            self.head = -1
+            self.tail = -1
+
+
+class ClockCache:
+    """
+    Approximate-LRU cache using the CLOCK (second-chance) algorithm.
+
+    Entries occupy fixed slots with a per-slot referenced byte. get()
+    is a dict lookup plus one GIL-atomic bytearray store — no ordering
+    list, no lock. Eviction sweeps a clock hand over the slots under
+    the lock, granting each referenced slot a second chance (clearing
+    its byte) and evicting the first unreferenced one, which
+    approximates LRU closely on skewed workloads.
+
+    A read that races slot recycling is detected via a monotonic
+    recycle counter and retried under the lock, so get() never returns
+    a value that was not stored for the requested key.
+    """
+
+    __slots__ = ("capacity", "cache", "keys", "vals", "ref", "hand",
+                 "lock", "_version")
+
+    def __init__(self, capacity: int):
+        """
+        Initialize the CLOCK cache.
+
+        Args:
+            capacity: Maximum number of items the cache can hold
+        """
+        if capacity <= 0:
+            raise ValueError("Capacity must be positive")
+
+        self.capacity = capacity
+        self.cache = {}  # key -> slot index
+        self.keys = [None] * capacity
+        self.vals = [None] * capacity
+        self.ref = bytearray(capacity)  # referenced bits, one byte each
+        self.hand = 0
+        self.lock = _thread.allocate_lock()
+
+        # Monotonic recycle counter, bumped under the lock whenever a
+        # slot changes hands (eviction or clear). Lock-free readers
+        # snapshot it around their read and retry under the lock on
+        # any change; unlike re-checking the key-to-slot mapping, a
+        # counter that only grows cannot be fooled by an eviction that
+        # later restores the same mapping (ABA).
+        self._version = 0
+
+    def get(self, key: int) -> int:
+        """
+        Get the value for a key if it exists, otherwise return -1.
+        Accessing a key sets its referenced byte; no list is touched
+        and no lock is taken on this path.
+
+        Time Complexity: O(1)
+        """
+        version = self._version
+        slot = self.cache.get(key, -1)
+        if slot < 0:
+            return -1
+        value = self.vals[slot]
+        if self._version != version:
+            # A slot was recycled somewhere between the snapshot and
+            # the value read, so the value may belong to another key;
+            # retry under the lock.
+            with self.lock:
+                slot = self.cache.get(key, -1)
+                if slot < 0:
+                    return -1
+                value = self.vals[slot]
+        self.ref[slot] = 1
+        return value
+
+    def put(self, key: int, value: int) -> None:
+        """
+        Insert or update a key-value pair. On a full cache the clock
+        hand sweeps forward, clearing referenced bytes, and evicts the
+        first slot found unreferenced since its last sweep.
+
+        Amortized O(1): each sweep step clears a bit that some get()
+        paid to set.
+        """
+        with self.lock:
+            slot = self.cache.get(key, -1)
+            if slot >= 0:
+                # Existing key: update in place and mark referenced
+                self.vals[slot] = value
+                self.ref[slot] = 1
+                return
+            if len(self.cache) < self.capacity:
+                # Still filling: slots are handed out sequentially
+                slot = len(self.cache)
+            else:
+                # Bump before mutating so a lock-free reader cannot
+                # observe this recycle's writes under its old snapshot
+                self._version += 1
+                ref = self.ref
+                hand = self.hand
+                wrap = self.capacity - 1
+                while ref[hand]:
+                    # Second chance: clear and move on
+                    ref[hand] = 0
+                    hand = 0 if hand == wrap else hand + 1
+                del self.cache[self.keys[hand]]
+                slot = hand
+                self.hand = 0 if hand == wrap else hand + 1
+            self.keys[slot] = key
+            self.vals[slot] = value
+            self.cache[key] = slot
+            self.ref[slot] = 1
+
+    def clear(self) -> None:
+        """Remove every entry, resetting the slot bookkeeping in place."""
+        with self.lock:
+            self._version += 1  # Every slot changes hands
+            self.cache.clear()
+            for slot in range(self.capacity):
+                self.keys[slot] = None
+                self.vals[slot] = None
+                self.ref[slot] = 0
+            self.hand = 0
+
+
+class ShardedLRUCache:
+    """
+    Thread-safe LRU cache striped across independent LRUCache shards.
+
+    Keys are routed to one of `shards` sub-caches by hash; each shard
+    has its own lock and 1/shards of the capacity, so threads touching
+    disjoint keys proceed in parallel instead of contending on a single
+    lock. Eviction order is exact within each shard and approximate in
+    aggregate.
+    """
+
+    __slots__ = ("capacity", "shards", "_mask")
+
+    def __init__(self, capacity: int, shards: int = 16):
+        """
+        Initialize the sharded cache.
+
+        Args:
+            capacity: Maximum number of items across all shards
+            shards: Number of sub-caches; must be a power of two so the
+                route computation is a mask rather than a modulo
+        """
+        if capacity <= 0:
+            raise ValueError("Capacity must be positive")
+        if shards <= 0 or shards & (shards - 1):
+            raise ValueError("Shard count must be a positive power of two")
+
+        self.capacity = capacity
+        self.shards = [LRUCache(max(1, capacity // shards))
+                       for _ in range(shards)]
+        self._mask = shards - 1
+
+    def get(self, key: int) -> int:
+        """
+        Get the value for a key from its shard, or -1 if absent.
+
+        Time Complexity: O(1)
+        """
+        return self.shards[hash(key) & self._mask].get(key)
+
+    def put(self, key: int, value: int) -> None:
+        """
+        Insert or update a key-value pair in its shard.
+
+        Time Complexity: O(1)
+        """
+        self.shards[hash(key) & self._mask].put(key, value)
+
+    def flush(self) -> None:
+        """Replay this thread's buffered recency updates in every shard."""
+        for shard in self.shards:
+            shard.flush()
+
+    def clear(self) -> None:
+        """Remove every entry from every shard, in place."""
+        for shard in self.shards:
+            shard.clear()
+
+
+# Specialized classes generated by make_lru(), keyed by capacity
+_SPECIALIZED = {}
+
+# Source template for make_lru(): the capacity is baked in as a literal
+# (a LOAD_CONST instead of an attribute load on every put) and the
+# recency/eviction helpers are inlined straight into get() and put().
+_SPECIALIZED_TEMPLATE = '''\
+class _LRU{capacity}:
+    """Exact-LRU cache specialized at runtime for capacity {capacity}."""
+
+    __slots__ = ("cache", "lock")
+
+    capacity = {capacity}
+
+    def __init__(self):
+        self.cache = {{}}
+        self.lock = _thread.allocate_lock()
+
+    def get(self, key):
+        """Return the value for key (marking it MRU), or -1 if absent."""
+        with self.lock:
+            cache = self.cache
+            if key not in cache:
+                return -1
+            value = cache[key] = cache.pop(key)
+            return value
+
+    def put(self, key, value):
+        """Insert or update key, evicting the LRU entry when full."""
+        with self.lock:
+            cache = self.cache
+            if key in cache:
+                cache.pop(key)
+            elif len(cache) >= {capacity}:
+                del cache[next(iter(cache))]
+            cache[key] = value
+'''
+
+
+def make_lru(capacity: int):
+    """
+    Return an exact-LRU cache built from a class generated for this
+    exact capacity.
+
+    The class source is rendered with the capacity as a literal and
+    compiled once per distinct capacity (generated classes are cached
+    in a module-level dict), trading a one-time exec() for fewer
+    attribute loads and no helper-call dispatch on every operation.
+    Unlike LRUCache this variant has no segments, Bloom filter, or
+    batched recency updates — it is the minimal single-lock design.
+
+    Args:
+        capacity: Maximum number of items the cache can hold
+    """
+    if capacity <= 0:
+        raise ValueError("Capacity must be positive")
+    cls = _SPECIALIZED.get(capacity)
+    if cls is None:
+        namespace = {"_thread": _thread}
+        code = compile(_SPECIALIZED_TEMPLATE.format(capacity=capacity),
+                       "<make_lru capacity=%d>" % capacity, "exec")
+        exec(code, namespace)
+        cls = _SPECIALIZED[capacity] = namespace["_LRU%d" % capacity]
+    return cls()
+
 
+# C-accelerated variant: same get/put API with the linked-list surgery in
+# a C extension (see _lrunode.c). Falls back to the pure-Python class
+# when the extension was not built.
+try:
+    from _lrunode import LRUCache as CLRUCache
+except ImportError:
+    CLRUCache = LRUCache
@@ -0,0 +1,34 @@
+"""
+Packaging for the thread-safe LRU cache.
+
+By default lru_cache is installed as a plain Python module. Setting
+LRU_CACHE_USE_CYTHON=1 compiles lru_cache.py with Cython in pure-Python
+mode instead, which removes interpreter dispatch from the get()/put()
+hot path with no source changes (requires Cython at build time):
+
+    LRU_CACHE_USE_CYTHON=1 pip install .
+
+If the compiled module is absent at runtime, imports fall back to the
+pure-Python source transparently — the module name is the same either way.
+"""
+
+import os
+
+from setuptools import Extension, setup
+
+# The C accelerator is optional: if it fails to build (no compiler, no
+# headers), installation proceeds with the pure-Python module only.
+ext_modules = [Extension("_lrunode", ["_lrunode.c"], optional=True)]
+if os.environ.get("LRU_CACHE_USE_CYTHON"):
+    # Opt-in: fail loudly if Cython was requested but is unavailable
+    from Cython.Build import cythonize
+
+    ext_modules += cythonize(["lru_cache.py"], language_level=3)
+
+setup(
+    name="thread-safe-lru-cache",
+    version="1.0.0",
+    description="Thread-safe LRU cache with O(1) get/put",
+    py_modules=["lru_cache"],
+    ext_modules=ext_modules,
+)
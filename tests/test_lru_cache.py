@@ -0,0 +1,325 @@
+"""
+Test suite for the thread-safe LRU cache module.
+
+Ported from the former ``if __name__ == "__main__"`` block in
+lru_cache.py so importing the module no longer carries the test code.
+"""
+
+import threading
+
+import pytest
+
+from lru_cache import (
+    CLRUCache,
+    ClockCache,
+    IntLRUCache,
+    LRUCache,
+    ShardedLRUCache,
+    make_lru,
+)
+
+
+def test_basic_get_put():
+    cache = LRUCache(2)
+    cache.put(1, 1)
+    cache.put(2, 2)
+    assert cache.get(1) == 1
+
+    cache.put(3, 3)  # Evicts key 2
+    assert cache.get(2) == -1
+    assert cache.get(3) == 3
+
+    cache.put(4, 4)  # Evicts key 1
+    assert cache.get(1) == -1
+    assert cache.get(3) == 3
+    assert cache.get(4) == 4
+
+
+def test_update_existing_key():
+    cache = LRUCache(2)
+    cache.put(1, 1)
+    cache.put(2, 2)
+    cache.put(1, 10)  # Update key 1
+    assert cache.get(1) == 10
+    assert cache.get(2) == 2
+
+
+def test_capacity_one():
+    cache = LRUCache(1)
+    cache.put(1, 1)
+    cache.put(2, 2)
+    assert cache.get(1) == -1
+    assert cache.get(2) == 2
+
+
+@pytest.mark.parametrize("capacity", [0, -1])
+def test_invalid_capacity(capacity):
+    with pytest.raises(ValueError):
+        LRUCache(capacity)
+
+
+def test_multiple_evictions():
+    cache = LRUCache(3)
+    cache.put(1, 1)
+    cache.put(2, 2)
+    cache.put(3, 3)
+    cache.get(1)  # Mark 1 as recently used
+    cache.put(4, 4)  # Should evict 2 (least recently used)
+    assert cache.get(2) == -1
+    assert cache.get(1) == 1
+    assert cache.get(3) == 3
+    assert cache.get(4) == 4
+
+
+def test_thread_safety():
+    cache = LRUCache(100)
+    results = []
+    errors = []
+
+    def worker(thread_id):
+        try:
+            for i in range(50):
+                key = thread_id * 1000 + i
+                cache.put(key, i)
+                results.append(cache.get(key) == i)
+        except Exception as e:  # pragma: no cover - failure reporting
+            errors.append(str(e))
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(10)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert errors == []
+    assert all(results)
+
+
+def test_access_order_maintained():
+    cache = LRUCache(3)
+    cache.put(1, 1)
+    cache.put(2, 2)
+    cache.put(3, 3)
+    # Access pattern: 1, 3, 2 (2 ends most recent, 1 least recent)
+    cache.get(1)
+    cache.get(3)
+    cache.get(2)
+    cache.put(4, 4)  # Should evict 1
+    assert cache.get(1) == -1
+    assert cache.get(2) == 2
+    assert cache.get(3) == 3
+    assert cache.get(4) == 4
+
+
+def test_memoize_decorator():
+    calls = []
+
+    @LRUCache.memoize(2)
+    def square(n):
+        calls.append(n)
+        return n * n
+
+    assert square(2) == 4
+    assert square(3) == 9
+    square(2)  # Cached: no new call
+    assert calls == [2, 3]
+    square(4)  # Evicts 3 (least recently used)
+    square(3)  # Re-invokes
+    assert calls == [2, 3, 4, 3]
+
+    with pytest.raises(ValueError):
+        LRUCache.memoize(0)
+
+
+def test_c_accelerated_variant():
+    cache = CLRUCache(2)
+    cache.put(1, 1)
+    cache.put(2, 2)
+    cache.get(1)  # Mark 1 as recently used
+    cache.put(3, 3)  # Should evict 2
+    assert cache.get(2) == -1
+    assert cache.get(1) == 1
+    assert cache.get(3) == 3
+
+    with pytest.raises(ValueError):
+        CLRUCache(0)
+
+
+def test_slru_scan_resistance():
+    cache = LRUCache(4)
+    cache.put(1, 1)
+    cache.get(1)  # Promote key 1 to the protected segment
+    # Scan of one-shot keys larger than remaining capacity
+    for k in range(100, 106):
+        cache.put(k, k)
+    assert cache.get(1) == 1
+    assert cache.get(100) == -1
+
+
+def test_sharded_routing():
+    cache = ShardedLRUCache(64, shards=4)
+    for k in range(32):
+        cache.put(k, k * 10)
+    assert all(cache.get(k) == k * 10 for k in range(32))
+    assert cache.get(999) == -1
+
+    with pytest.raises(ValueError):
+        ShardedLRUCache(64, shards=3)
+
+
+def test_sharded_concurrency():
+    cache = ShardedLRUCache(1024, shards=8)
+    results = []
+
+    def worker(thread_id):
+        for i in range(50):
+            key = thread_id * 1000 + i
+            cache.put(key, i)
+            results.append(cache.get(key) == i)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert all(results)
+
+
+def test_negative_cache_under_heavy_eviction():
+    cache = LRUCache(4)
+    # Enough distinct inserts to trigger a Bloom filter rebuild
+    for k in range(5000):
+        cache.put(k, k)
+    assert all(cache.get(k) == -1 for k in range(100))
+    assert all(cache.get(k) == k for k in range(4996, 5000))
+    assert cache.get(10**9) == -1
+
+
+def test_int_cache_exact_lru():
+    cache = IntLRUCache(3)
+    cache.put(1, 1)
+    cache.put(2, 2)
+    cache.put(3, 3)
+    cache.get(1)  # Mark 1 as recently used
+    cache.put(4, 4)  # Should evict 2
+    assert cache.get(2) == -1
+    assert cache.get(1) == 1
+    assert cache.get(4) == 4
+    cache.put(1, 10)
+    assert cache.get(1) == 10
+
+    # Rejected puts (non-int key, out-of-range value) must leave the
+    # full cache untouched: no entry lost, no slot leaked
+    with pytest.raises(TypeError):
+        cache.put("a", 1)
+    with pytest.raises(OverflowError):
+        cache.put(5, 2**70)
+    assert cache.get(1) == 10
+    assert cache.get(4) == 4
+    cache.put(7, 7)  # Evicts 3 (least recently used)
+    assert cache.get(3) == -1
+    assert cache.get(7) == 7
+
+
+def test_make_lru_specialization():
+    cache = make_lru(2)
+    cache.put(1, 1)
+    cache.put(2, 2)
+    cache.get(1)  # Mark 1 as recently used
+    cache.put(3, 3)  # Should evict 2
+    assert cache.get(2) == -1
+    assert cache.get(1) == 1
+    assert cache.get(3) == 3
+
+    assert type(make_lru(2)) is type(cache)
+    assert type(make_lru(3)) is not type(cache)
+    assert type(cache).capacity == 2
+
+    with pytest.raises(ValueError):
+        make_lru(0)
+
+
+def test_clear_resets_in_place():
+    cache = LRUCache(3)
+    cache.put(1, 1)
+    cache.get(1)  # Promote so both segments are populated
+    cache.put(2, 2)
+    segment = cache.probation
+    cache.clear()
+    assert cache.get(1) == -1
+    assert cache.get(2) == -1
+    assert cache.probation is segment  # Cleared in place, not reallocated
+    cache.put(5, 50)
+    assert cache.get(5) == 50
+
+
+def test_clear_int_cache_recycles_slots():
+    cache = IntLRUCache(2)
+    cache.put(1, 1)
+    cache.put(2, 2)
+    cache.clear()
+    assert cache.get(1) == -1
+    cache.put(3, 3)
+    cache.put(4, 4)
+    cache.put(5, 5)  # Evicts 3: slots recycle correctly
+    assert cache.get(3) == -1
+    assert cache.get(5) == 5
+
+
+def test_clear_sharded():
+    cache = ShardedLRUCache(16, shards=2)
+    cache.put(1, 1)
+    cache.clear()
+    assert cache.get(1) == -1
+
+
+def test_clock_second_chance():
+    cache = ClockCache(3)
+    cache.put(1, 1)
+    cache.put(2, 2)
+    cache.put(3, 3)
+    # All slots hold their insertion second chance: the sweep clears
+    # them and evicts the oldest slot (key 1)
+    cache.put(4, 4)
+    assert cache.get(1) == -1
+    cache.get(2)  # Referenced: survives the next sweep
+    cache.put(5, 5)  # Evicts key 3, sparing the referenced key 2
+    assert cache.get(3) == -1
+    assert cache.get(2) == 2
+    assert cache.get(4) == 4
+    assert cache.get(5) == 5
+
+    cache.clear()
+    assert cache.get(2) == -1
+    cache.put(7, 70)
+    assert cache.get(7) == 70
+
+    with pytest.raises(ValueError):
+        ClockCache(0)
+
+
+def test_clock_concurrent_reads_return_owned_values():
+    # Tiny capacity so every put recycles a slot: a reader racing the
+    # recycle must never see a value stored for a different key
+    cache = ClockCache(2)
+    errors = []
+
+    def writer():
+        for i in range(20000):
+            k = i % 4
+            cache.put(k, k * 7)
+
+    def reader():
+        for i in range(20000):
+            k = i % 4
+            v = cache.get(k)
+            if v not in (-1, k * 7):
+                errors.append((k, v))
+
+    threads = ([threading.Thread(target=writer) for _ in range(2)]
+               + [threading.Thread(target=reader) for _ in range(2)])
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert errors == []